@@ -1,11 +1,14 @@
 import sys
 from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QFrame, QLineEdit, QGraphicsScene, 
-                             QGraphicsView, QGraphicsPolygonItem, QGraphicsTextItem, 
-                             QGraphicsProxyWidget)
-from PyQt6.QtGui import QColor, QBrush, QPen, QFont, QPolygonF, QPainter, QTextOption
-from PyQt6.QtCore import Qt, QPointF
+                             QGraphicsView, QGraphicsItem, QGraphicsPolygonItem, 
+                             QGraphicsRectItem, QGraphicsTextItem)
+from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+from PyQt6.QtGui import (QColor, QBrush, QPen, QFont, QPolygonF, QPainter, QTextOption, 
+                         QTransform, QOpenGLContext)
+from PyQt6.QtCore import Qt, QPointF, QEvent
 import math
+from functools import lru_cache
 
 # --- Constants and Configuration ---
 APP_BG_COLOR = "#1e1e1e"
@@ -14,135 +17,278 @@ ACCENT_COLOR = "#d9534f"
 FRAME_BG_COLOR = "#2a2a2a"
 FRAME_BORDER_COLOR = "#444444"
 
+# Application stylesheet, formatted once at import
+_APP_QSS = f"""
+    QWidget {{
+        background-color: {APP_BG_COLOR};
+        color: {PRIMARY_TEXT_COLOR};
+        font-family: Roboto, sans-serif;
+    }}
+    QFrame {{
+        background-color: {FRAME_BG_COLOR};
+        border: 1px solid {FRAME_BORDER_COLOR};
+        border-radius: 8px;
+        padding: 10px;
+    }}
+    QLabel#Header {{
+        font-size: 16px; font-weight: bold; color: {ACCENT_COLOR};
+        padding-bottom: 5px; border: none; border-bottom: 2px solid {FRAME_BORDER_COLOR}; margin-bottom: 10px;
+    }}
+    QLabel {{
+        font-size: 14px;
+    }}
+    QLabel#StatusTitle, QLabel#StatusText {{
+        border: none; padding: 0px;
+    }}
+    QLabel#StatusTitle {{
+        font-weight: bold;
+    }}
+    QLineEdit {{
+        background-color: #333;
+        border: 1px solid #555;
+        border-radius: 4px;
+        padding: 5px;
+        font-size: 14px;
+    }}
+"""
+
 HEX_ARCHETYPE_COLOR = QColor(ACCENT_COLOR)
 HEX_QUALITY_COLOR = QColor("#5a5a5a")
 HEX_ABILITY_COLOR = QColor("#3c3c3c")
 HEX_BORDER_COLOR = QColor("#1a1a1a")
+HEX_TEXT_COLOR = QColor(PRIMARY_TEXT_COLOR)
+HEX_PLACEHOLDER_COLOR = QColor(PRIMARY_TEXT_COLOR)
+HEX_PLACEHOLDER_COLOR.setAlpha(128)
+
+_HEX_FONT = QFont("Roboto")
+_HEX_FONT.setPixelSize(10)
+_HEX_FONT.setBold(True)
+
+# Shared drawing resources; every hexagon of a given type looks the same
+_HEX_BRUSHES = {
+    "Archetype": QBrush(HEX_ARCHETYPE_COLOR),
+    "Quality": QBrush(HEX_QUALITY_COLOR),
+    "Ability": QBrush(HEX_ABILITY_COLOR)
+}
+_HEX_PEN = QPen(HEX_BORDER_COLOR, 2)
+
+@lru_cache(maxsize=None)
+def hexagon_polygon(size):
+    """Returns the (shared) QPolygonF for a flat-topped hexagon."""
+    return QPolygonF([QPointF(size * math.cos(math.pi / 3 * i), size * math.sin(math.pi / 3 * i))
+                      for i in range(6)])
+
+# Neighbour directions clockwise from the top, in (h_dist, v_dist) units
+_HEX_DIRECTIONS = ((0, -1), (1, -0.5), (1, 0.5), (0, 1), (-1, 0.5), (-1, -0.5))
+
+def hex_ring(radius):
+    """Returns the offsets of a ring of hexagons around the origin, clockwise from the top."""
+    offsets = []
+    x, y = 0, -radius
+    for i in range(6):
+        dx, dy = _HEX_DIRECTIONS[(i + 2) % 6]
+        for _ in range(radius):
+            offsets.append((x, y))
+            x, y = x + dx, y + dy
+    return tuple(offsets)
+
+# Ring offsets for the Hero Sheet, in (h_dist, v_dist) units
+_QUALITY_OFFSETS = hex_ring(1)
+_ABILITY_OFFSETS = hex_ring(2)
+
+class HexTextItem(QGraphicsTextItem):
+    """A single-paragraph editable text item that shows placeholder text while empty."""
+    def __init__(self, placeholder_text, max_height, parent=None):
+        super().__init__(parent)
+        self.placeholder_text = placeholder_text
+        self.max_height = max_height
+        self._accepted_text = ""
+        self._adjusting = False
+        self.document().contentsChanged.connect(self.on_contents_changed)
+
+    def keyPressEvent(self, event):
+        """Ignores Return/Enter so the text stays on a single paragraph."""
+        if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            event.ignore()
+            return
+        super().keyPressEvent(event)
+
+    def sceneEvent(self, event):
+        """Moves focus to the next/previous hexagon on Tab/Backtab instead of typing a tab."""
+        if event.type() == QEvent.Type.KeyPress and event.key() in (Qt.Key.Key_Tab, Qt.Key.Key_Backtab):
+            self.focus_neighbour(event.key() == Qt.Key.Key_Tab)
+            return True
+        return super().sceneEvent(event)
+
+    def focus_neighbour(self, forward):
+        """Gives keyboard focus to the text of the next (or previous) hexagon on the sheet."""
+        hexagon = self.parentItem()
+        siblings = hexagon.parentItem().childItems() if hexagon.parentItem() else [hexagon]
+        index = siblings.index(hexagon) + (1 if forward else -1)
+        siblings[index % len(siblings)].text_item.setFocus(
+            Qt.FocusReason.TabFocusReason if forward else Qt.FocusReason.BacktabFocusReason)
+
+    def on_contents_changed(self):
+        """Flattens pasted line breaks, rejects edits that outgrow max_height and re-centers."""
+        if self._adjusting:
+            return
+        self._adjusting = True
+        position = self.textCursor().position()
+        text = self.toPlainText()
+        changed = False
+        if self.document().blockCount() > 1 or "\u2028" in self.document().toRawText():
+            text = " ".join(text.splitlines())
+            self.setPlainText(text)
+            changed = True
+        if self.boundingRect().height() > self.max_height:
+            # Too long to fit inside the hexagon: undo the edit that overflowed it
+            position -= len(text) - len(self._accepted_text)
+            self.setPlainText(self._accepted_text)
+            changed = True
+        if changed:
+            self.set_cursor_position(position)
+        self._accepted_text = self.toPlainText()
+        self.center_vertically()
+        self._adjusting = False
+
+    def set_cursor_position(self, position):
+        """Moves the text cursor to position, clamped to the current text."""
+        cursor = self.textCursor()
+        cursor.setPosition(max(0, min(position, len(self.toPlainText()))))
+        self.setTextCursor(cursor)
+
+    def center_vertically(self):
+        """Centers the item vertically on its parent's origin."""
+        self.setY(-self.boundingRect().height() / 2)
+
+    def paint(self, painter, option, widget=None):
+        """Draws the placeholder behind the (empty) document."""
+        if self.document().isEmpty():
+            painter.save()
+            painter.setFont(self.font())
+            painter.setPen(HEX_PLACEHOLDER_COLOR)
+            painter.drawText(self.boundingRect(), Qt.AlignmentFlag.AlignCenter, self.placeholder_text)
+            painter.restore()
+        super().paint(painter, option, widget)
 
 class EditableHexagon(QGraphicsPolygonItem):
     """An interactive hexagon on the Hero Sheet for entering traits."""
-    def __init__(self, x, y, size, hex_type="Ability", placeholder_text="ABILITY"):
-        super().__init__()
+    def __init__(self, x, y, size, hex_type="Ability", placeholder_text="ABILITY", parent=None):
+        super().__init__(parent)
         
         self.setPos(x, y)
         self.hex_type = hex_type
         
-        # Create the hexagon shape
-        polygon = self.create_hexagon_polygon(size)
-        self.setPolygon(polygon)
-        
-        # Set colors based on type
-        self.set_colors()
-        self.setPen(QPen(HEX_BORDER_COLOR, 2))
+        # Shape and colors are shared between all hexagons
+        self.setPolygon(hexagon_polygon(size))
+        self.setBrush(_HEX_BRUSHES.get(hex_type, _HEX_BRUSHES["Ability"]))
+        self.setPen(_HEX_PEN)
+        self._shape = None
         
-        # Create an editable text item and embed it
-        self.text_item = QLineEdit()
-        self.text_item.setPlaceholderText(placeholder_text.upper())
-        self.text_item.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.text_item.setStyleSheet("""
-            QLineEdit {
-                background-color: transparent;
-                border: none;
-                color: #e0e0e0;
-                font-size: 10px;
-                font-weight: bold;
-            }
-        """)
+        # The hexagon itself never changes, so paint it once into a pixmap
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         
-        # Use a proxy widget to place the QLineEdit onto the QGraphicsScene
-        proxy = QGraphicsProxyWidget(self)
-        proxy.setWidget(self.text_item)
+        # The editable text is a native child item of the hexagon
+        self.text_item = HexTextItem(placeholder_text.upper(), size, self)
+        self.text_item.setFont(_HEX_FONT)
+        self.text_item.setDefaultTextColor(HEX_TEXT_COLOR)
+        self.text_item.setTextInteractionFlags(Qt.TextInteractionFlag.TextEditorInteraction)
+        self.text_item.setTextWidth(size * 1.6)
+        # Wrap long words too, so the text never gets wider than the hexagon; the item
+        # caps its height at size (three lines) so it never spills onto neighbours
+        text_option = QTextOption(Qt.AlignmentFlag.AlignCenter)
+        text_option.setWrapMode(QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere)
+        self.text_item.document().setDefaultTextOption(text_option)
         
-        # Center the text edit area within the hexagon
-        proxy.setPos(-size * 0.8, -size * 0.5)
-        proxy.resize(size * 1.6, size)
-
-    def set_colors(self):
-        """Sets the hexagon's fill color based on its type."""
-        color_map = {
-            "Archetype": HEX_ARCHETYPE_COLOR,
-            "Quality": HEX_QUALITY_COLOR,
-            "Ability": HEX_ABILITY_COLOR
-        }
-        fill_color = color_map.get(self.hex_type, HEX_ABILITY_COLOR)
-        self.setBrush(QBrush(fill_color))
-
-    def create_hexagon_polygon(self, size):
-        """Creates the QPolygonF for a flat-topped hexagon."""
-        polygon = QPolygonF()
-        for i in range(6):
-            angle = math.pi / 180 * (60 * i)
-            polygon.append(QPointF(size * math.cos(angle), size * math.sin(angle)))
-        return polygon
+        # Center the text area within the hexagon
+        self.text_item.setX(-size * 0.8)
+        self.text_item.center_vertically()
+
+    def shape(self):
+        """Returns the hit-test shape, built once since the polygon and pen never change."""
+        if self._shape is None:
+            self._shape = super().shape()
+        return self._shape
+
+    def paint(self, painter, option, widget=None):
+        """Paints the hexagon, smoothing the edges of the Archetype only."""
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, self.hex_type == "Archetype")
+        super().paint(painter, option, widget)
 
 class HeroSheetView(QGraphicsView):
     """A view that displays the entire interactive Hero Sheet."""
     def __init__(self):
         super().__init__()
+        # Let the GPU rasterize the scene when OpenGL is available, else keep the raster viewport
+        if QOpenGLContext().create():
+            self.setViewport(QOpenGLWidget())
+            # The OpenGL viewport can't do partial updates, so skip the dirty-region bookkeeping;
+            # every keystroke or cursor blink repaints the whole sheet, with each hexagon a cached blit
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
         self.scene = QGraphicsScene()
+        # The sheet is small and static, so a BSP index is pure overhead
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.setScene(self.scene)
         self.setBackgroundBrush(QBrush(QColor(FRAME_BG_COLOR)))
-        self.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)
+        # The sheet is always scaled to fit, so scroll bars are never needed
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._last_scale = None
         
         self.draw_hero_sheet_layout()
     
     def draw_hero_sheet_layout(self):
         """Creates and places all the hexagons for the character sheet."""
-        self.scene.clear()
-        
         size = 60
         spacing = 8
         hex_height = size * math.sqrt(3)
         v_dist = hex_height + spacing
         h_dist = (size * 2 * 0.75) + (spacing * 0.75)
 
+        # All hexagons hang off one invisible root so the scene sees a single insert
+        root = QGraphicsRectItem()
+        root.setFlag(QGraphicsItem.GraphicsItemFlag.ItemHasNoContents)
+
         # Create Archetype (center)
-        self.scene.addItem(EditableHexagon(0, 0, size, "Archetype", "ARCHETYPE"))
+        EditableHexagon(0, 0, size, "Archetype", "ARCHETYPE", root)
         
-        # --- FIX: Create all 6 Qualities (inner ring) ---
-        quality_positions = [
-            QPointF(0, -v_dist),
-            QPointF(h_dist, -v_dist / 2),
-            QPointF(h_dist, v_dist / 2),
-            QPointF(0, v_dist),
-            QPointF(-h_dist, v_dist / 2),
-            QPointF(-h_dist, -v_dist / 2),
-        ]
-        for pos in quality_positions:
-            self.scene.addItem(EditableHexagon(pos.x(), pos.y(), size, "Quality", "QUALITY"))
-
-        # --- FIX: Create all 12 Abilities (outer ring) ---
-        ability_positions = [
-            QPointF(0, -v_dist * 2),
-            QPointF(h_dist, -v_dist * 1.5),
-            QPointF(h_dist * 2, -v_dist),
-            QPointF(h_dist * 2, 0),
-            QPointF(h_dist * 2, v_dist),
-            QPointF(h_dist, v_dist * 1.5),
-            QPointF(0, v_dist * 2),
-            QPointF(-h_dist, v_dist * 1.5),
-            QPointF(-h_dist * 2, v_dist),
-            QPointF(-h_dist * 2, 0),
-            QPointF(-h_dist * 2, -v_dist),
-            QPointF(-h_dist, -v_dist * 1.5),
-        ]
-        for pos in ability_positions:
-            self.scene.addItem(EditableHexagon(pos.x(), pos.y(), size, "Ability", "ABILITY"))
-
-        items_rect = self.scene.itemsBoundingRect()
-        self.setSceneRect(items_rect.adjusted(-20, -20, 20, 20))
+        # Create all 6 Qualities (inner ring)
+        for dx, dy in _QUALITY_OFFSETS:
+            EditableHexagon(dx * h_dist, dy * v_dist, size, "Quality", "QUALITY", root)
+
+        # Create all 12 Abilities (outer ring)
+        for dx, dy in _ABILITY_OFFSETS:
+            EditableHexagon(dx * h_dist, dy * v_dist, size, "Ability", "ABILITY", root)
+
+        self.scene.addItem(root)
+
+        # Two rings around the center plus a 20px margin on every side
+        self._scene_w = 4 * h_dist + 2 * size + 40
+        self._scene_h = 4 * v_dist + hex_height + 40
+        self.setSceneRect(-self._scene_w / 2, -self._scene_h / 2, self._scene_w, self._scene_h)
 
     def resizeEvent(self, event):
-        """Re-centers the view on resize."""
+        """Re-scales the view on resize."""
         super().resizeEvent(event)
-        self.fitInView(self.scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
+        viewport = self.viewport()
+        if viewport.width() <= 0 or viewport.height() <= 0:
+            return
+        scale = min(viewport.width() / self._scene_w, viewport.height() / self._scene_h)
+        
+        # Growing by less than 1% still fits, so keep the current transform
+        if self._last_scale is not None and 0 <= scale / self._last_scale - 1 < 0.01:
+            return
+        self.setTransform(QTransform.fromScale(scale, scale))
+        self._last_scale = scale
 
 class PlayerApp(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Not The End - Hero Sheet")
         self.setGeometry(150, 150, 1000, 900)
-        self.setStyleSheet(self.load_stylesheet())
 
         self.main_layout = QVBoxLayout()
         self.setLayout(self.main_layout)
@@ -207,10 +353,8 @@ class PlayerApp(QWidget):
         mind_layout.addWidget(mind_label)
         
         mind_grid = QHBoxLayout()
-        confusion_label = QLabel("<b>CONFUSION</b><br>In the next TEST add 🎲 instead of ⚪ to the BAG.")
-        adrenaline_label = QLabel("<b>ADRENALINE</b><br>In the next TEST you must draw at least 4 🎲.")
-        mind_grid.addWidget(confusion_label)
-        mind_grid.addWidget(adrenaline_label)
+        mind_grid.addWidget(self.create_status_box("CONFUSION", "In the next TEST add 🎲 instead of ⚪ to the BAG."))
+        mind_grid.addWidget(self.create_status_box("ADRENALINE", "In the next TEST you must draw at least 4 🎲."))
         mind_layout.addLayout(mind_grid)
 
         panel_layout.addWidget(misfortunes_frame, 2)
@@ -218,39 +362,41 @@ class PlayerApp(QWidget):
         
         return panel
 
-    def load_stylesheet(self):
-        """Loads the QSS for styling the application."""
-        return f"""
-            QWidget {{
-                background-color: {APP_BG_COLOR};
-                color: {PRIMARY_TEXT_COLOR};
-                font-family: Roboto, sans-serif;
-            }}
-            QFrame {{
-                background-color: {FRAME_BG_COLOR};
-                border: 1px solid {FRAME_BORDER_COLOR};
-                border-radius: 8px;
-                padding: 10px;
-            }}
-            QLabel#Header {{
-                font-size: 16px; font-weight: bold; color: {ACCENT_COLOR};
-                padding-bottom: 5px; border: none; border-bottom: 2px solid {FRAME_BORDER_COLOR}; margin-bottom: 10px;
-            }}
-            QLabel {{
-                font-size: 14px;
-            }}
-            QLineEdit {{
-                background-color: #333;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 5px;
-                font-size: 14px;
-            }}
-        """
+    def create_status_box(self, title, description):
+        """Creates a titled box for a single Mind Status, using plain-text labels."""
+        box = QFrame()
+        box_layout = QVBoxLayout()
+        box_layout.setContentsMargins(0, 0, 0, 0)
+        box_layout.setSpacing(0)
+        box.setLayout(box_layout)
+        
+        title_label = QLabel(title)
+        title_label.setObjectName("StatusTitle")
+        description_label = QLabel(description)
+        description_label.setObjectName("StatusText")
+        box_layout.addWidget(title_label)
+        box_layout.addWidget(description_label)
+        
+        return box
 
 # --- Main execution block ---
 if __name__ == '__main__':
     app = QApplication(sys.argv)
+    # Set once on the application so Qt parses the rules a single time
+    app.setStyleSheet(_APP_QSS)
+    
+    if '--profile' in sys.argv:
+        # Profile window construction; render with e.g. `gprof2dot -f pstats player_app.pstat`
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        for _ in range(20):
+            PlayerApp().ensurePolished()
+            app.processEvents()
+        profiler.disable()
+        profiler.dump_stats("player_app.pstat")
+        sys.exit(0)
+    
     window = PlayerApp()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file